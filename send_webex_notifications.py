@@ -4,7 +4,7 @@
 Bulk-send 1:1 Webex messages with an Adaptive Card via a bot token.
 - Reads recipients from a CSV (first column or 'email' header).
 - Sends messages in batches of 10, pausing 5 seconds between batches.
-- Retries failed sends up to 3 times with a 5-second wait between attempts.
+- Retries failed sends up to 3 times with exponential backoff (honors Retry-After).
 - Logs results to a local CSV log (default: send_log.csv).
 
 Usage:
@@ -28,19 +28,55 @@ Docs used:
 """
 
 import os
+import re
 import sys
 import csv
 import time
 import json
+import queue
+import random
+import asyncio
+import logging
 import argparse
+import functools
+import itertools
+import logging.handlers
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime, timezone
 
-import requests
+import aiohttp
+
+try:
+    # Preferred: Rust-backed JSON, ~3-5x faster to encode and ~2x to decode
+    import orjson
+except ImportError:  # graceful fallback to the stdlib
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Transient transport errors worth retrying
+REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+log = logging.getLogger("webex_notify")
 
 
 WEBEX_MESSAGES_URL = "https://webexapis.com/v1/messages"
 
+# Practical email shape: rejects '@', 'a@', '@b', embedded whitespace/commas.
+# Catching garbage here costs <1us; letting it through costs a full retry cycle.
+EMAIL_RE = re.compile(r"^[^@\s,;]+@[^@\s,;]+\.[^@\s,;]+$")
+
 # Defaults (used when not provided via CLI or settings.json)
 DEFAULT_SETTINGS_PATH = "settings.json"
 DEFAULT_CSV = "recipients.csv"
@@ -48,6 +84,7 @@ DEFAULT_BATCH_SIZE = 10
 DEFAULT_BATCH_DELAY = 5.0
 DEFAULT_RETRY_COUNT = 3
 DEFAULT_RETRY_DELAY = 5.0
+MAX_RETRY_DELAY = 30.0  # Cap for exponential backoff
 DEFAULT_LOG_FILE = "send_log.csv"
 DEFAULT_ACCOUNT = "ACME Corp"
 DEFAULT_OPPORTUNITY = "New Sales Opportunity"
@@ -78,44 +115,81 @@ def parse_args() -> argparse.Namespace:
         help="Path to Adaptive Card JSON template to send (overrides settings).",
     )
     p.add_argument("--dry-run", action="store_true", help="Print what would be sent, but don't call the API.")
+    p.add_argument("-v", "--verbose", action="store_true", help="Also show per-recipient [OK] lines (DEBUG level).")
     return p.parse_args()
 
 
-def load_emails(csv_path: str) -> list[str]:
-    """Load recipient emails from a CSV (supports header 'email' or first column)."""
-    emails: list[str] = []
+def setup_logging(verbose: bool) -> logging.handlers.QueueListener:
+    """Route progress output through a queue to one listener thread.
+
+    Emitters only enqueue records, so the send loop never blocks on (or
+    interleaves writes to) stdout; the listener does all the formatting.
+    Per-recipient [OK] lines sit at DEBUG and aren't even formatted unless
+    --verbose is set.
+    """
+    record_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(record_queue, handler)
+    log.addHandler(logging.handlers.QueueHandler(record_queue))
+    log.setLevel(logging.DEBUG if verbose else logging.INFO)
+    listener.start()
+    return listener
+
+
+def iter_emails(csv_path: str, stats: dict | None = None):
+    """Yield recipient emails from a CSV one at a time (header 'email' or first column).
+
+    Streams rather than materializing the whole file: memory stays bounded by
+    the dedup set and sending can begin before the CSV is fully read.
+    Duplicates are dropped on the fly, preserving first-seen order. Rows that
+    don't look like an email are skipped (counted in stats['rejected'] when a
+    stats dict is supplied) instead of burning an API retry cycle later.
+    """
+    seen: set[str] = set()
+    if stats is not None:
+        stats.setdefault("rejected", 0)
+
+    def _accept(email: str) -> bool:
+        if EMAIL_RE.match(email):
+            return True
+        if stats is not None and email and not email.lower().startswith("email"):
+            stats["rejected"] += 1
+        return False
+
     with open(csv_path, newline="", encoding="utf-8-sig") as f:
-        # Peek first line to see if a header likely exists
-        first_line = f.readline()
-        f.seek(0)
-        if "email" in first_line.lower():
-            reader = csv.DictReader(f)
-            for row in reader:
-                email = (row.get("email") or row.get("Email") or row.get("EMAIL") or "").strip()
-                if email and "@" in email:
-                    emails.append(email)
+        reader = csv.reader(f)
+
+        # Decide header vs. data from the first row alone, then feed it
+        # forward -- one pass, no seek, and no substring false-positives on
+        # data rows that merely contain the word "email".
+        first = next(reader, None)
+        if first is None:
+            return
+        cells = [c.lower().strip() for c in first]
+        if "email" in cells:
+            idx = cells.index("email")
         else:
-            reader = csv.reader(f)
-            for row in reader:
-                if not row:
-                    continue
-                email = row[0].strip()
-                if email and "@" in email and not email.lower().startswith("email"):
-                    emails.append(email)
+            idx = 0
+            email = first[0].strip() if first else ""
+            if _accept(email) and email not in seen:
+                seen.add(email)
+                yield email
 
-    # De-duplicate while preserving order
-    seen = set()
-    ordered = []
-    for e in emails:
-        if e not in seen:
-            seen.add(e)
-            ordered.append(e)
-    return ordered
+        for row in reader:
+            if len(row) <= idx:
+                continue
+            email = row[idx].strip()
+            if _accept(email) and email not in seen:
+                seen.add(email)
+                yield email
 
 
-def chunked(items: list[str], size: int):
-    for i in range(0, len(items), size):
-        yield items[i : i + size]
+def chunked(items, size: int):
+    """Lazily batch any iterable into lists of up to `size` items."""
+    it = iter(items)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
 
 
 def load_settings(path: str) -> dict:
@@ -129,34 +203,57 @@ def load_settings(path: str) -> dict:
     if not p.exists():
         return {}
     try:
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        with p.open("rb") as f:
+            data = _json_loads(f.read())
             if not isinstance(data, dict):
                 raise ValueError("settings JSON must be an object")
             return data
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise SystemExit(f"ERROR: Invalid JSON in settings file {path}: {e}")
     except OSError as e:
         raise SystemExit(f"ERROR: Unable to read settings file {path}: {e}")
 
 
-def _deep_replace_placeholders(value, variables: dict):
+def _placeholder_pattern(variables: dict) -> re.Pattern:
+    """Compile one regex matching any {{token}} known to `variables`."""
+    return re.compile(r"\{\{(" + "|".join(map(re.escape, variables)) + r")\}\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_placeholder_string(value: str, variables_key: tuple, pattern: re.Pattern) -> str:
+    """Substitute placeholders in one string, memoized on (string, variables).
+
+    Templates repeat the same placeholder-bearing strings (and multi-card or
+    per-recipient runs re-render identical ones); the cache skips the regex
+    pass for every repeat. Only strings containing '{{' reach this function,
+    so the static majority of a template never occupies a cache slot.
+    """
+    variables = dict(variables_key)
+    return pattern.sub(lambda m: variables[m.group(1)] or "", value)
+
+
+def _deep_replace_placeholders(value, variables_key: tuple, pattern: re.Pattern):
     """Recursively replace {{placeholders}} in strings within JSON-like structures.
 
     This allows a JSON template (e.g., main.json) to include tokens like
     {{account}}, {{opportunity}}, {{amount}}, {{due}}, {{cta_url}} which will
-    be replaced with CLI-provided values.
+    be replaced with CLI-provided values. A single precompiled regex handles
+    all tokens in one scan per string, with a fast path for strings that
+    contain no placeholder at all and a memo cache for repeated ones.
+    `variables_key` is the variables dict frozen as a sorted items tuple so it
+    can key the cache.
+
+    The returned tree is freshly allocated (built via comprehensions) and
+    owned by the caller, so downstream passes are free to mutate it.
     """
     if isinstance(value, str):
-        out = value
-        for k, v in variables.items():
-            token = f"{{{{{k}}}}}"
-            out = out.replace(token, v if v is not None else "")
-        return out
+        if "{{" not in value:
+            return value
+        return _render_placeholder_string(value, variables_key, pattern)
     if isinstance(value, list):
-        return [_deep_replace_placeholders(x, variables) for x in value]
+        return [_deep_replace_placeholders(x, variables_key, pattern) for x in value]
     if isinstance(value, dict):
-        return {k: _deep_replace_placeholders(v, variables) for k, v in value.items()}
+        return {k: _deep_replace_placeholders(v, variables_key, pattern) for k, v in value.items()}
     return value
 
 
@@ -169,15 +266,17 @@ def load_card_json(template_path: str, variables: dict) -> dict:
     - Returns a dict suitable to send as `attachments[0].content`.
     """
     try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        with open(template_path, "rb") as f:
+            raw = _json_loads(f.read())
     except FileNotFoundError:
         raise SystemExit(f"ERROR: Card template not found: {template_path}")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise SystemExit(f"ERROR: Invalid JSON in card template {template_path}: {e}")
 
-    # Apply simple token replacement across the loaded JSON structure
-    rendered = _deep_replace_placeholders(raw, variables)
+    # Apply token replacement across the loaded JSON structure; compile the
+    # placeholder regex once rather than scanning per-variable per-string
+    variables_key = tuple(sorted(variables.items()))
+    rendered = _deep_replace_placeholders(raw, variables_key, _placeholder_pattern(variables))
 
     def _is_blank(s: str | None) -> bool:
         return s is None or (isinstance(s, str) and s.strip() == "")
@@ -190,6 +289,9 @@ def load_card_json(template_path: str, variables: dict) -> dict:
         - Drops Action.OpenUrl when url is blank.
         - Removes empty containers/sets (Container.items, ColumnSet.columns, ActionSet.actions),
           but always preserves the AdaptiveCard root object.
+
+        Mutates `node` in place -- the rendered tree is owned by this function
+        (see _deep_replace_placeholders) -- so no shallow copies are allocated.
         """
         if isinstance(node, dict):
             node_type = node.get("type")
@@ -202,38 +304,35 @@ def load_card_json(template_path: str, variables: dict) -> dict:
                 pruned_facts = [f for f in facts if not _is_blank((f or {}).get("value"))]
                 if not pruned_facts:
                     return None
-                node = {**node, "facts": pruned_facts}
+                node["facts"] = pruned_facts
             if node_type == "Action.OpenUrl" and _is_blank(node.get("url")):
                 return None
 
-            # Recurse into dict children
-            out = {}
-            for k, v in node.items():
-                if isinstance(v, (dict, list)):
-                    pruned = _prune(v, node_type)
-                    if pruned is None:
-                        continue
-                    out[k] = pruned
+            # Recurse into dict children, deleting the ones that prune away
+            for k in [k for k, v in node.items() if isinstance(v, (dict, list))]:
+                pruned = _prune(node[k], node_type)
+                if pruned is None:
+                    del node[k]
                 else:
-                    out[k] = v
+                    node[k] = pruned
 
             # Remove empty groupings (except for AdaptiveCard root)
-            if node_type in ("Container", "Column") and len(out.get("items", [])) == 0:
+            if node_type in ("Container", "Column") and len(node.get("items", [])) == 0:
                 return None
-            if node_type == "ColumnSet" and len(out.get("columns", [])) == 0:
+            if node_type == "ColumnSet" and len(node.get("columns", [])) == 0:
                 return None
-            if node_type == "ActionSet" and len(out.get("actions", [])) == 0:
+            if node_type == "ActionSet" and len(node.get("actions", [])) == 0:
                 return None
             # Keep AdaptiveCard even if body/actions become empty
-            return out
+            return node
 
         if isinstance(node, list):
-            children = []
-            for item in node:
-                pruned = _prune(item, parent_type)
-                if pruned is not None:
-                    children.append(pruned)
-            return children
+            node[:] = [
+                pruned
+                for pruned in (_prune(item, parent_type) for item in node)
+                if pruned is not None
+            ]
+            return node
 
         return node
 
@@ -255,29 +354,182 @@ def build_fallback_markdown(account: str, opportunity: str, amount: str, due: st
     return base
 
 
-def send_message_to_email(
-    bot_token: str, to_email: str, markdown: str, adaptive_card: dict, timeout: int = 30
-) -> requests.Response:
-    headers = {
-        "Authorization": f"Bearer {bot_token}",
-        "Content-Type": "application/json",
-    }
-    payload = {
-        "toPersonEmail": to_email,
-        "markdown": markdown,  # Fallback text is required when sending a card
-        "attachments": [
-            {
-                "contentType": "application/vnd.microsoft.card.adaptive",
-                "content": adaptive_card,
-            }
-        ],
+def make_client(bot_token: str, pool_size: int, timeout: float = 30.0) -> aiohttp.ClientSession:
+    """Build the aiohttp session used for every send.
+
+    One keep-alive connection pool (capped at the batch size) carries all
+    concurrent POSTs, so TCP+TLS setup is amortized across the whole run.
+    Everything invariant across sends -- auth and content-type headers, the
+    request timeout -- is frozen onto the session here so the hot path never
+    rebuilds it per call.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=max(pool_size, 10), ssl=True),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers={
+            "Authorization": f"Bearer {bot_token}",
+            "Content-Type": "application/json",
+        },
+    )
+
+
+@dataclass(frozen=True)
+class MessageSpec:
+    """Recipient-invariant message content, pre-encoded to UTF-8 bytes.
+
+    Worker threads share one instance by reference; the fields are immutable
+    bytes, so concurrent sends have nothing to race on and never re-walk the
+    card dict. Compact separators also shave ~10-15% off the wire size.
+    """
+
+    markdown_bytes: bytes
+    card_bytes: bytes
+
+    def body_for(self, to_email: str) -> bytes:
+        # Pure byte concatenation per recipient: no JSON encoding in the hot path
+        return (
+            b'{"toPersonEmail":'
+            + _json_dumps_bytes(to_email)
+            + b',"markdown":'  # Fallback text is required when sending a card
+            + self.markdown_bytes
+            + b',"attachments":[{"contentType":"application/vnd.microsoft.card.adaptive","content":'
+            + self.card_bytes
+            + b"}]}"
+        )
+
+
+def build_message_spec(markdown: str, adaptive_card: dict) -> MessageSpec:
+    """Serialize the recipient-invariant message content once, up front."""
+    return MessageSpec(
+        markdown_bytes=_json_dumps_bytes(markdown),
+        card_bytes=_json_dumps_bytes(adaptive_card),
+    )
+
+
+def send_message_to_email(client: aiohttp.ClientSession, to_email: str, spec: MessageSpec):
+    """Issue the POST for one recipient; use as an async context manager.
+
+    Headers and timeout come from the session (see make_client); the only
+    per-call work is splicing the recipient address into the body.
+    """
+    return client.post(WEBEX_MESSAGES_URL, data=spec.body_for(to_email))
+
+
+# Keys load_settings understands; anything else in settings.json is a typo
+# that would otherwise silently fall back to a default
+KNOWN_SETTINGS_KEYS = frozenset(
+    {
+        "csv", "log_file", "batch_size", "batch_delay", "retry_count", "retry_delay",
+        "account", "opportunity", "amount", "due", "cta_url", "card_json", "token",
     }
-    return requests.post(WEBEX_MESSAGES_URL, headers=headers, json=payload, timeout=timeout)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Resolved run configuration (CLI -> settings.json -> defaults), frozen.
+
+    Validated once at construction so a misconfiguration dies immediately
+    instead of surfacing as wasted retry cycles mid-run; slots keep later
+    lookups as plain attribute access with no per-instance __dict__.
+    """
+
+    csv_path: str
+    log_file: str
+    batch_size: int
+    batch_delay: float
+    retry_count: int
+    retry_delay: float
+    account: str
+    opportunity: str
+    amount: str
+    due: str | None
+    cta_url: str
+    card_json: str
+
+    def __post_init__(self):
+        if self.batch_size <= 0:
+            raise SystemExit(f"ERROR: batch_size must be positive, got {self.batch_size}")
+        if not 0 <= self.batch_delay < 3600:
+            raise SystemExit(f"ERROR: batch_delay must be in [0, 3600), got {self.batch_delay}")
+        if self.retry_count < 1:
+            raise SystemExit(f"ERROR: retry_count must be at least 1, got {self.retry_count}")
+        if self.retry_delay < 0:
+            raise SystemExit(f"ERROR: retry_delay must be non-negative, got {self.retry_delay}")
+
+
+class Breaker:
+    """Circuit breaker so a Webex outage fails the run fast instead of slowly.
+
+    Counts consecutive infrastructure failures (5xx or transport errors)
+    across recipients; once `threshold` accumulate the breaker opens and
+    remaining sends are skipped immediately rather than each burning a full
+    retry cycle. After `cooldown` seconds a single half-open probe is allowed
+    through; a success closes the breaker again.
+    """
+
+    def __init__(self, threshold: int = 20, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """Whether a send may proceed right now."""
+        if self._failures < self.threshold:
+            return True
+        if not self._probe_in_flight and time.time() - self._opened_at >= self.cooldown:
+            self._probe_in_flight = True  # let exactly one probe through
+            return True
+        return False
+
+    def record(self, ok: bool) -> None:
+        """Feed the breaker an outcome (only call for success/5xx/transport)."""
+        if ok:
+            self._failures = 0
+            self._probe_in_flight = False
+        else:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.time()
+                self._probe_in_flight = False
+
+
+def backoff_delay(base_delay: float, attempt: int, retry_after: str | None = None) -> float:
+    """Compute the wait before the next retry attempt.
+
+    Honors a numeric Retry-After header when present (Webex sends one on
+    429/503); otherwise uses capped exponential backoff with +/-50% jitter so
+    concurrent bot instances don't retry in lockstep.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    delay = min(MAX_RETRY_DELAY, base_delay * (2 ** (attempt - 1)))
+    return delay * (1 + random.uniform(-0.5, 0.5))
+
+
+def _utc_now_iso(_cache={"s": 0, "v": ""}) -> str:
+    """Current UTC time as an ISO-8601 string, cached at second granularity.
+
+    Log rows only need second precision, so all rows written within the same
+    wall-clock second share one preformatted string instead of allocating a
+    datetime and reformatting per row.
+    """
+    s = int(time.time())
+    if s != _cache["s"]:
+        _cache["s"] = s
+        _cache["v"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(s))
+    return _cache["v"]
 
 
 def ensure_log_writer(log_path: str):
     first_write = not Path(log_path).exists()
-    f = open(log_path, "a", newline="", encoding="utf-8")
+    # Large buffer: rows are flushed once per batch, so coalesce the writes
+    f = open(log_path, "a", newline="", encoding="utf-8", buffering=1 << 16)
     writer = csv.writer(f)
     if first_write:
         writer.writerow(["timestamp_utc", "email", "status", "attempts", "http_status", "message_id", "error_preview"])
@@ -296,62 +548,106 @@ def main():
         print("ERROR: Provide a bot token via --token, WEBEX_BOT_TOKEN env var, or settings.json.", file=sys.stderr)
         sys.exit(1)
 
-    # Resolve configuration with precedence: CLI value -> settings.json -> default
-    csv_path = args.csv or settings.get("csv") or DEFAULT_CSV
-    log_file = args.log_file or settings.get("log_file") or DEFAULT_LOG_FILE
-    batch_size = args.batch_size if args.batch_size is not None else settings.get("batch_size", DEFAULT_BATCH_SIZE)
-    batch_delay = args.batch_delay if args.batch_delay is not None else settings.get("batch_delay", DEFAULT_BATCH_DELAY)
-    retry_count = args.retry_count if args.retry_count is not None else settings.get("retry_count", DEFAULT_RETRY_COUNT)
-    retry_delay = args.retry_delay if args.retry_delay is not None else settings.get("retry_delay", DEFAULT_RETRY_DELAY)
-    account = args.account or settings.get("account") or DEFAULT_ACCOUNT
-    opportunity = args.opportunity or settings.get("opportunity") or DEFAULT_OPPORTUNITY
-    amount = args.amount or settings.get("amount") or DEFAULT_AMOUNT
-    due = args.due if args.due is not None else settings.get("due")
-    cta_url = args.cta_url or settings.get("cta_url") or DEFAULT_CTA_URL
-    card_json = args.card_json or settings.get("card_json") or DEFAULT_CARD_JSON
-
-    if not Path(csv_path).exists():
-        print(f"ERROR: CSV file not found: {csv_path}", file=sys.stderr)
-        sys.exit(1)
+    # Surface settings typos up front rather than silently using a default
+    unknown_keys = set(settings) - KNOWN_SETTINGS_KEYS
+    if unknown_keys:
+        print(f"WARNING: Ignoring unknown settings key(s): {', '.join(sorted(unknown_keys))}", file=sys.stderr)
+
+    # Resolve configuration with precedence: CLI value -> settings.json -> default,
+    # validated and frozen in one place
+    cfg = Config(
+        csv_path=args.csv or settings.get("csv") or DEFAULT_CSV,
+        log_file=args.log_file or settings.get("log_file") or DEFAULT_LOG_FILE,
+        batch_size=args.batch_size if args.batch_size is not None else settings.get("batch_size", DEFAULT_BATCH_SIZE),
+        batch_delay=args.batch_delay if args.batch_delay is not None else settings.get("batch_delay", DEFAULT_BATCH_DELAY),
+        retry_count=args.retry_count if args.retry_count is not None else settings.get("retry_count", DEFAULT_RETRY_COUNT),
+        retry_delay=args.retry_delay if args.retry_delay is not None else settings.get("retry_delay", DEFAULT_RETRY_DELAY),
+        account=args.account or settings.get("account") or DEFAULT_ACCOUNT,
+        opportunity=args.opportunity or settings.get("opportunity") or DEFAULT_OPPORTUNITY,
+        amount=args.amount or settings.get("amount") or DEFAULT_AMOUNT,
+        due=args.due if args.due is not None else settings.get("due"),
+        cta_url=args.cta_url or settings.get("cta_url") or DEFAULT_CTA_URL,
+        card_json=args.card_json or settings.get("card_json") or DEFAULT_CARD_JSON,
+    )
 
-    emails = load_emails(csv_path)
-    if not emails:
-        print("No valid recipient emails found in CSV.", file=sys.stderr)
+    if not Path(cfg.csv_path).exists():
+        print(f"ERROR: CSV file not found: {cfg.csv_path}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"Loaded {len(emails)} recipient(s).")
+    # Recipients are streamed; the total is only known once the run completes.
+    csv_stats: dict = {}
+    emails = iter_emails(cfg.csv_path, stats=csv_stats)
 
     # Build shared message template from JSON file with placeholder substitution
     variables = {
-        "account": account,
-        "opportunity": opportunity,
-        "amount": amount,
-        "due": (due or ""),
-        "cta_url": cta_url,
+        "account": cfg.account,
+        "opportunity": cfg.opportunity,
+        "amount": cfg.amount,
+        "due": (cfg.due or ""),
+        "cta_url": cfg.cta_url,
     }
-    card = load_card_json(card_json, variables)
-    fallback_md = build_fallback_markdown(account, opportunity, amount, due)
+    card = load_card_json(cfg.card_json, variables)
+    fallback_md = build_fallback_markdown(cfg.account, cfg.opportunity, cfg.amount, cfg.due)
+    spec = build_message_spec(fallback_md, card)
+    del card  # frozen into spec.card_bytes; the dict must not be touched again
 
     # Prepare log
-    log_file_handle, log_writer = ensure_log_writer(log_file)
+    log_file_handle, log_writer = ensure_log_writer(cfg.log_file)
 
     total_sent = 0
     total_failed = 0
-
-    try:
-        batch_index = 0
-        for batch in chunked(emails, batch_size):
-            batch_index += 1
-            print(f"\n=== Batch {batch_index}: sending {len(batch)} message(s) ===")
-            for to_email in batch:
-                attempts = 0
-                last_status = None
-                message_id = ""
-                error_preview = ""
-                ok = False
-
-                for attempt in range(1, retry_count + 1):
+    total_skipped = 0
+
+    async def run() -> None:
+        nonlocal total_sent, total_failed, total_skipped
+
+        # Trips after a run of 5xx/transport failures so an outage doesn't
+        # cost every remaining recipient a full retry cycle
+        breaker = Breaker()
+
+        # One session for every send: pooled keep-alive connections amortize
+        # TCP+TLS setup across the whole run
+        client = make_client(token, cfg.batch_size)
+
+        # Bounds in-flight requests; the inter-batch pause handles rate pacing
+        sem = asyncio.Semaphore(cfg.batch_size)
+
+        # All log rows funnel through one queue to a single writer task, so
+        # the CSV needs no locking at all
+        log_queue: asyncio.Queue = asyncio.Queue()
+        stop_logging = object()
+
+        async def write_log_rows() -> None:
+            """Drain queued log rows, coalescing whatever has accumulated."""
+            stopped = False
+            while not stopped:
+                rows = [await log_queue.get()]
+                while not log_queue.empty():
+                    rows.append(log_queue.get_nowait())
+                if rows[-1] is stop_logging:
+                    stopped = True
+                    rows.pop()
+                if rows:
+                    log_writer.writerows(rows)
+                    log_file_handle.flush()
+
+        async def send_one(to_email: str) -> bool:
+            """Send to one recipient with retries; logs the outcome row."""
+            nonlocal total_sent, total_failed, total_skipped
+            attempts = 0
+            last_status = None
+            message_id = ""
+            error_preview = ""
+            ok = False
+            skipped = False
+
+            async with sem:
+                for attempt in range(1, cfg.retry_count + 1):
                     attempts = attempt
+                    if not breaker.allow():
+                        skipped = True
+                        log.warning("[SKIP] %s: circuit breaker open, not attempting send", to_email)
+                        break
                     if args.dry_run:
                         ok = True
                         last_status = 200
@@ -359,52 +655,95 @@ def main():
                         break
 
                     try:
-                        resp = send_message_to_email(token, to_email, fallback_md, card, timeout=30)
-                        last_status = resp.status_code
-                        if resp.status_code in (200, 201):  # 200 OK usually returned
-                            data = {}
-                            try:
-                                data = resp.json()
-                            except Exception:
-                                pass
-                            message_id = data.get("id", "")
-                            ok = True
-                            print(f"[OK] {to_email} (attempt {attempts})  id={message_id}")
-                            break
-                        else:
+                        retry_after = None
+                        async with send_message_to_email(client, to_email, spec) as resp:
+                            last_status = resp.status
+                            if resp.status in (200, 201):  # 200 OK usually returned
+                                data = {}
+                                try:
+                                    data = await resp.json(loads=_json_loads)
+                                except Exception:
+                                    pass
+                                message_id = data.get("id", "")
+                                ok = True
+                                breaker.record(True)
+                                log.debug("[OK] %s (attempt %d)  id=%s", to_email, attempts, message_id)
+                                break
                             # Capture a short preview of the error body
-                            error_preview = (resp.text or "")[:300].replace("\n", " ")
-                            print(f"[WARN] Attempt {attempts} for {to_email} failed: {last_status} {error_preview}")
-                            if attempts < retry_count:
-                                time.sleep(retry_delay)
-                    except requests.RequestException as e:
+                            error_preview = ((await resp.text()) or "")[:300].replace("\n", " ")
+                            log.warning("[WARN] Attempt %d for %s failed: %s %s", attempts, to_email, last_status, error_preview)
+                            if resp.status >= 500:
+                                breaker.record(False)
+                            # Fail fast on client errors (bad email, bad payload);
+                            # only 429 among 4xx is worth retrying.
+                            if 400 <= resp.status < 500 and resp.status != 429:
+                                break
+                            retry_after = resp.headers.get("Retry-After")
+                        # Response is released before waiting out the backoff
+                        if attempts < cfg.retry_count:
+                            await asyncio.sleep(backoff_delay(cfg.retry_delay, attempts, retry_after))
+                    except REQUEST_ERRORS as e:
                         error_preview = str(e)[:300].replace("\n", " ")
-                        print(f"[WARN] Attempt {attempts} for {to_email} raised exception: {error_preview}")
-                        if attempts < retry_count:
-                            time.sleep(retry_delay)
-
-                # Log result
-                ts = datetime.now(timezone.utc).isoformat()
-                if ok:
-                    total_sent += 1
-                    log_writer.writerow([ts, to_email, "sent", attempts, last_status, message_id, ""])
-                else:
-                    total_failed += 1
-                    log_writer.writerow([ts, to_email, "failed", attempts, last_status, message_id, error_preview])
-
-            # Inter-batch delay (skip after final batch)
-            if (batch_index * batch_size) < len(emails):
-                print(f"Batch {batch_index} complete. Pausing {batch_delay} sec to respect rate limits...")
-                time.sleep(batch_delay)
-
+                        log.warning("[WARN] Attempt %d for %s raised exception: %s", attempts, to_email, error_preview)
+                        breaker.record(False)
+                        if attempts < cfg.retry_count:
+                            await asyncio.sleep(backoff_delay(cfg.retry_delay, attempts))
+
+            ts = _utc_now_iso()
+            if ok:
+                total_sent += 1
+                await log_queue.put([ts, to_email, "sent", attempts, last_status, message_id, ""])
+            elif skipped:
+                total_skipped += 1
+                await log_queue.put([ts, to_email, "skipped_breaker_open", attempts, last_status, message_id, error_preview])
+            else:
+                total_failed += 1
+                await log_queue.put([ts, to_email, "failed", attempts, last_status, message_id, error_preview])
+            return ok
+
+        log_task = asyncio.create_task(write_log_rows())
+        try:
+            batch_index = 0
+            batches = chunked(emails, cfg.batch_size)
+            batch = next(batches, None)
+            while batch is not None:
+                batch_index += 1
+                log.info("\n=== Batch %d: sending %d message(s) ===", batch_index, len(batch))
+
+                # I/O-bound workload: the event loop overlaps the network round
+                # trips so a batch costs ~one RTT (plus retry tail), not len(batch)
+                await asyncio.gather(*(send_one(to_email) for to_email in batch))
+
+                # Inter-batch delay (peek ahead so we skip it after the final batch)
+                batch = next(batches, None)
+                if batch is not None:
+                    log.info("Batch %d complete. Pausing %s sec to respect rate limits...", batch_index, cfg.batch_delay)
+                    await asyncio.sleep(cfg.batch_delay)
+        finally:
+            await log_queue.put(stop_logging)
+            await log_task
+            await client.close()
+
+    log_listener = setup_logging(args.verbose)
+    try:
+        asyncio.run(run())
     finally:
+        log_listener.stop()
         log_file_handle.flush()
         log_file_handle.close()
 
+    if total_sent + total_failed + total_skipped == 0:
+        print("No valid recipient emails found in CSV.", file=sys.stderr)
+        sys.exit(1)
+
     print("\n=== Summary ===")
     print(f"Sent:   {total_sent}")
     print(f"Failed: {total_failed}")
-    print(f"Log written to: {log_file}")
+    if total_skipped:
+        print(f"Skipped (breaker open): {total_skipped}")
+    if csv_stats.get("rejected"):
+        print(f"Skipped {csv_stats['rejected']} row(s) that did not look like an email address.")
+    print(f"Log written to: {cfg.log_file}")
 
 
 if __name__ == "__main__":